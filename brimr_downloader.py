@@ -16,38 +16,54 @@ Features:
 Requirements:
     pip install selenium webdriver-manager requests
 
+Optional:
+    pip install pyahocorasick   # faster file categorization
+
 Usage:
     python brimr_downloader.py
 """
 
 from __future__ import annotations
 
+import functools
+import hashlib
+import json
 import logging
+import os
 import platform
-import queue
 import re
 import shutil
+import sys
 import threading
 import time
+from collections import Counter, deque
+from concurrent.futures import Future, ThreadPoolExecutor, as_completed
 from datetime import datetime
 from pathlib import Path
-from typing import TYPE_CHECKING, Callable
-from urllib.parse import unquote, urlparse
+from types import MappingProxyType
+from typing import TYPE_CHECKING, Callable, Mapping
+from urllib.parse import unquote
 
 import requests
-from selenium import webdriver
-from selenium.webdriver.chrome.options import Options
-from selenium.webdriver.chrome.service import Service
-from selenium.webdriver.common.by import By
-from selenium.webdriver.support import expected_conditions as EC
-from selenium.webdriver.support.ui import WebDriverWait
-from webdriver_manager.chrome import ChromeDriverManager
+from requests.adapters import HTTPAdapter
+from urllib3.exceptions import HTTPError as Urllib3HTTPError
+from urllib3.util.retry import Retry
+
+try:
+    import ahocorasick  # Optional: pip install pyahocorasick
+except ImportError:
+    ahocorasick = None
 
+# Selenium and webdriver_manager are imported where they are used, so the
+# GUI and year detection start without loading them
 if TYPE_CHECKING:
     from tkinter import Event
 
+    from selenium import webdriver
+
 import tkinter as tk
 from tkinter import filedialog, messagebox, ttk
+from tkinter import font as tkfont
 
 # =============================================================================
 # Configuration Constants - Adjust these if needed
@@ -55,11 +71,63 @@ from tkinter import filedialog, messagebox, ttk
 
 PAGE_LOAD_TIMEOUT: int = 15
 DOWNLOAD_TIMEOUT: int = 90
-EXTRA_RENDER_WAIT: float = 2.0
 DOWNLOAD_CHECK_INTERVAL: float = 0.3
-UI_QUEUE_POLL_MS: int = 100
+DOWNLOAD_CHECK_MAX_INTERVAL: float = 1.5
+UI_QUEUE_POLL_MS_MIN: int = 33
+UI_QUEUE_POLL_MS_MAX: int = 500
+YEAR_PROBE_WORKERS: int = 16
+DOWNLOAD_WORKERS: int = 8
+HTTP_POOL_SIZE: int = 32
+HTTP_RETRIES: int = 2
+YEAR_COLUMNS: int = 5
+YEAR_ROW_HEIGHT: int = 26
+
+CHROMEDRIVER_CACHE_FILE: Path = (
+    Path.home() / ".cache" / "brimr_downloader" / "chromedriver_path.json"
+)
+
+# Sidecar in the output folder mapping content digests to downloaded files
+HASH_INDEX_FILENAME: str = ".brimr_hashes.json"
+
+EXCEL_SUFFIXES: tuple[str, ...] = (".xls", ".xlsx")
+TEMP_DOWNLOAD_SUFFIXES: tuple[str, ...] = (".crdownload", ".tmp", ".part")
 
 BASE_URL_TEMPLATE: str = "https://brimr.org/brimr-rankings-of-nih-funding-in-{year}/"
+RANKINGS_INDEX_URL: str = "https://brimr.org/brimr-rankings-of-nih-funding/"
+_YEAR_URL_RE = re.compile(r"brimr-rankings-of-nih-funding-in-(\d{4})")
+# Last path segment of an Excel link, ignoring any query string or fragment
+_URL_FILENAME_RE = re.compile(r"/([^/?#]+\.xlsx?)(?:[?#]|$)", re.IGNORECASE)
+
+# Requests Chrome should never make while scraping (analytics, trackers, fonts)
+BLOCKED_URL_PATTERNS: list[str] = [
+    "*google-analytics.com*", "*googletagmanager.com*", "*doubleclick.net*",
+    "*facebook.net*", "*facebook.com/tr*", "*hotjar.com*",
+    "*fonts.googleapis.com*", "*fonts.gstatic.com*",
+    "*.woff", "*.woff2", "*.ttf",
+]
+
+EXCEL_LINK_SELECTOR: str = (
+    "a[href$='.xls'], a[href$='.xlsx'], a[href$='.XLS'], a[href$='.XLSX'], "
+    "a[href*='.xls?'], a[href*='.xlsx?']"
+)
+
+# True once the document has loaded and no jQuery requests are in flight
+PAGE_READY_SCRIPT: str = (
+    "return document.readyState === 'complete'"
+    " && (window.jQuery ? jQuery.active == 0 : true);"
+)
+
+# Collects every href matching arguments[0] in a single WebDriver round trip
+EXCEL_LINKS_SCRIPT: str = (
+    "return Array.from(document.querySelectorAll(arguments[0]), a => a.href);"
+)
+
+HTTP_HEADERS: dict[str, str] = {
+    "User-Agent": (
+        "Mozilla/5.0 (Windows NT 10.0; Win64; x64) "
+        "AppleWebKit/537.36 Chrome/120.0.0.0 Safari/537.36"
+    ),
+}
 
 FILE_CATEGORIES: dict[str, list[str]] = {
     # Source/master data files - comprehensive institutional data
@@ -181,6 +249,56 @@ FILE_CATEGORIES: dict[str, list[str]] = {
     ],
 }
 
+# Characters invalid on Windows and generally unsafe in filenames
+_INVALID_FILENAME_CHARS = str.maketrans({ch: "_" for ch in '<>:"/\\|?*'})
+
+# Characters ignored when matching filenames against category patterns
+_STRIP_SEPARATORS = str.maketrans("", "", "-_")
+
+# FILE_CATEGORIES in matching form: lowercased, separators stripped and
+# interned, frozen so it cannot drift from the original. FILE_CATEGORIES
+# itself stays as written for readability and display.
+FILE_CATEGORIES_NORM: Mapping[str, tuple[str, ...]] = MappingProxyType({
+    category: tuple(
+        sys.intern(pattern.lower().translate(_STRIP_SEPARATORS))
+        for pattern in patterns
+    )
+    for category, patterns in FILE_CATEGORIES.items()
+})
+
+# PI markers that need underscores/hyphens preserved (checked on raw names)
+_PI_RAW_TAGS: tuple[str, ...] = ("_pi_", "_pi.", "pi_2", "contractspi")
+# PI markers checked on normalized names
+_PI_NORM_TAGS: tuple[str, ...] = ("allorgdeptpi", "deptschoolpi", "schooldeptpi")
+
+# (pattern, category) pairs sorted by pattern length descending so that
+# longer/more specific patterns match first. PI files are handled separately.
+_CATEGORY_PATTERNS: tuple[tuple[str, str], ...] = tuple(sorted(
+    (
+        (pattern, category)
+        for category, patterns in FILE_CATEGORIES_NORM.items()
+        if category != "06_PI_Rankings"
+        for pattern in patterns
+    ),
+    key=lambda x: len(x[0]),
+    reverse=True,
+))
+
+
+def _build_category_automaton():
+    """Build an Aho-Corasick automaton over the category patterns, if available."""
+    if ahocorasick is None:
+        return None
+    automaton = ahocorasick.Automaton()
+    for rank, (pattern, category) in enumerate(_CATEGORY_PATTERNS):
+        if pattern not in automaton:
+            automaton.add_word(pattern, (rank, category))
+    automaton.make_automaton()
+    return automaton
+
+
+_CATEGORY_AUTOMATON = _build_category_automaton()
+
 
 # =============================================================================
 # Logging Setup
@@ -218,8 +336,25 @@ def setup_logging(log_dir: Path) -> logging.Logger:
 # =============================================================================
 
 
+_XDG_DOWNLOAD_RE = re.compile(r'^XDG_DOWNLOAD_DIR="?([^"\n]*)"?', re.MULTILINE)
+
+
+def _read_xdg_download_dir() -> Path | None:
+    """Read the Downloads folder from user-dirs.dirs without spawning a process."""
+    config_home = os.environ.get("XDG_CONFIG_HOME") or Path.home() / ".config"
+    try:
+        text = (Path(config_home) / "user-dirs.dirs").read_text(encoding="utf-8")
+    except OSError:
+        return None
+    match = _XDG_DOWNLOAD_RE.search(text)
+    if not match or not match.group(1):
+        return None
+    return Path(match.group(1).replace("$HOME", str(Path.home())))
+
+
+@functools.lru_cache(maxsize=1)
 def get_downloads_folder() -> Path:
-    """Get the user's Downloads folder path (cross-platform)."""
+    """Get the user's Downloads folder path (cross-platform, cached)."""
     system = platform.system()
 
     if system == "Windows":
@@ -243,6 +378,9 @@ def get_downloads_folder() -> Path:
             return downloads
 
     if system == "Linux":
+        downloads = _read_xdg_download_dir()
+        if downloads:
+            return downloads
         try:
             import subprocess
             result = subprocess.run(
@@ -257,54 +395,106 @@ def get_downloads_folder() -> Path:
     return Path.home() / "Downloads"
 
 
+def create_http_session() -> requests.Session:
+    """Create a keep-alive HTTP session with pooled connections and retries."""
+    session = requests.Session()
+    session.headers.update(HTTP_HEADERS)
+    adapter = HTTPAdapter(
+        pool_connections=4,
+        pool_maxsize=HTTP_POOL_SIZE,
+        max_retries=Retry(total=HTTP_RETRIES, backoff_factor=0.3),
+    )
+    session.mount("https://", adapter)
+    session.mount("http://", adapter)
+    return session
+
+
+def _probe_year(
+    session: requests.Session,
+    year: int,
+    url: str,
+    logger: logging.Logger | None = None
+) -> bool:
+    """Return True if the ranking page for ``year`` exists."""
+    try:
+        # Try HEAD request first (faster)
+        response = session.head(url, timeout=6, allow_redirects=True)
+
+        if response.status_code == 200:
+            if logger:
+                logger.debug(f"Year {year} exists (HEAD)")
+            return True
+
+        if response.status_code in (403, 405):
+            # Some servers reject HEAD, try GET with stream=True (minimal download)
+            with session.get(
+                url, timeout=8, allow_redirects=True, stream=True
+            ) as response:
+                if response.status_code == 200:
+                    if logger:
+                        logger.debug(f"Year {year} exists (GET fallback)")
+                    return True
+
+    except requests.RequestException as e:
+        if logger:
+            logger.debug(f"Year {year} probe failed: {e}")
+
+    return False
+
+
+def _years_from_index(
+    session: requests.Session,
+    logger: logging.Logger | None = None
+) -> set[int]:
+    """Read the ranking years linked from the BRIMR rankings index page."""
+    try:
+        response = session.get(RANKINGS_INDEX_URL, timeout=10)
+        response.raise_for_status()
+    except requests.RequestException as e:
+        if logger:
+            logger.debug(f"Rankings index fetch failed: {e}")
+        return set()
+
+    current_year = datetime.now().year
+    found = _YEAR_URL_RE.findall(response.text)
+    return {year for year in map(int, found) if 2006 <= year <= current_year}
+
+
 def detect_available_years(logger: logging.Logger | None = None) -> list[int]:
     """
-    Detect available ranking years by checking which year URLs actually exist.
+    Detect available ranking years from the BRIMR website.
 
-    Probes individual year URLs from current year back to 2006 to find all valid years.
+    Reads the year links from the rankings index page in a single request. If
+    that yields nothing, probes individual year URLs from current year back to
+    2006; probes run concurrently and share one session, so detection takes
+    roughly one round trip instead of one per year.
     """
-    headers = {
-        "User-Agent": (
-            "Mozilla/5.0 (Windows NT 10.0; Win64; x64) "
-            "AppleWebKit/537.36 Chrome/120.0.0.0 Safari/537.36"
-        ),
-    }
-
-    years: set[int] = set()
     current_year = datetime.now().year
 
-    if logger:
-        logger.info(
-            f"Probing BRIMR for available years ({current_year} down to 2006)..."
-        )
+    with create_http_session() as session:
+        years = _years_from_index(session, logger)
 
-    # Probe every year from current down to 2006
-    for year in range(current_year, 2005, -1):
-        url = BASE_URL_TEMPLATE.format(year=year)
-        try:
-            # Try HEAD request first (faster)
-            response = requests.head(
-                url, headers=headers, timeout=6, allow_redirects=True
-            )
-
-            if response.status_code == 200:
-                years.add(year)
-                if logger:
-                    logger.debug(f"Year {year} exists (HEAD)")
-            elif response.status_code in (403, 405):
-                # Some servers reject HEAD, try GET with stream=True (minimal download)
-                response = requests.get(
-                    url, headers=headers, timeout=8, allow_redirects=True, stream=True
+        if not years:
+            if logger:
+                logger.info(
+                    f"Probing BRIMR for available years "
+                    f"({current_year} down to 2006)..."
                 )
-                if response.status_code == 200:
-                    years.add(year)
-                    if logger:
-                        logger.debug(f"Year {year} exists (GET fallback)")
 
-        except requests.RequestException as e:
-            if logger:
-                logger.debug(f"Year {year} probe failed: {e}")
-            continue
+            # Probe every year from current down to 2006
+            urls = {
+                year: BASE_URL_TEMPLATE.format(year=year)
+                for year in range(current_year, 2005, -1)
+            }
+
+            with ThreadPoolExecutor(max_workers=YEAR_PROBE_WORKERS) as executor:
+                futures = {
+                    executor.submit(_probe_year, session, year, url, logger): year
+                    for year, url in urls.items()
+                }
+                for future in as_completed(futures):
+                    if future.result():
+                        years.add(futures[future])
 
     if years:
         if logger:
@@ -317,49 +507,51 @@ def detect_available_years(logger: logging.Logger | None = None) -> list[int]:
     return list(range(2024, 2005, -1))
 
 
+@functools.lru_cache(maxsize=4096)
 def categorize_file(filename: str) -> str:
-    """Determine the category folder for a file based on its name."""
+    """Determine the category folder for a file based on its name (memoized)."""
     raw = filename.lower()
-    norm = raw.replace("-", "").replace("_", "")
+    norm = raw.translate(_STRIP_SEPARATORS)
 
     # Check PI files first (they often contain department names too)
     if "pi" in norm:
-        # Check patterns that need underscores/hyphens preserved
-        if any(tag in raw for tag in ["_pi_", "_pi.", "pi_2", "contractspi"]):
+        if any(tag in raw for tag in _PI_RAW_TAGS):
             return "06_PI_Rankings"
-        # Check normalized patterns
-        if any(tag in norm for tag in ["allorgdeptpi", "deptschoolpi", "schooldeptpi"]):
+        if any(tag in norm for tag in _PI_NORM_TAGS):
             return "06_PI_Rankings"
 
-    # Build list of (pattern, category) sorted by pattern length descending
-    # This ensures longer/more specific patterns match first
-    all_patterns: list[tuple[str, str]] = []
-    for category, patterns in FILE_CATEGORIES.items():
-        if category == "06_PI_Rankings":
-            continue
-        for pattern in patterns:
-            clean_pattern = pattern.replace("-", "").replace("_", "")
-            all_patterns.append((clean_pattern, category))
-
-    # Sort by pattern length descending (longest first)
-    all_patterns.sort(key=lambda x: len(x[0]), reverse=True)
+    if _CATEGORY_AUTOMATON is not None:
+        # Single pass over the name; the lowest rank is the longest pattern,
+        # which is the same match the linear scan below would pick
+        best = min(
+            (value for _, value in _CATEGORY_AUTOMATON.iter(norm)), default=None
+        )
+        return best[1] if best else "09_Uncategorized"
 
-    for pattern, category in all_patterns:
+    for pattern, category in _CATEGORY_PATTERNS:
         if pattern in norm:
             return category
 
     return "09_Uncategorized"
 
 
+def filename_from_url(url: str) -> str:
+    """Extract the decoded file name from the last segment of a URL path."""
+    match = _URL_FILENAME_RE.search(url)
+    if match:
+        return unquote(match.group(1))
+    path = url.split("#", 1)[0].split("?", 1)[0]
+    return unquote(path.rstrip("/").rsplit("/", 1)[-1])
+
+
+@functools.lru_cache(maxsize=2048)
 def sanitize_filename(filename: str) -> str:
     """Sanitize filename by removing query strings and invalid characters."""
     # Remove query string
     if "?" in filename:
         filename = filename.split("?", 1)[0]
     # Replace characters invalid on Windows and generally unsafe
-    invalid = '<>:"/\\|?*'
-    for ch in invalid:
-        filename = filename.replace(ch, "_")
+    filename = filename.translate(_INVALID_FILENAME_CHARS)
     # Trim whitespace and trailing dots (Windows quirk)
     return filename.strip().strip(".")
 
@@ -369,12 +561,70 @@ def sanitize_filename(filename: str) -> str:
 # =============================================================================
 
 
+def _read_cached_chromedriver_path() -> str | None:
+    """Return the ChromeDriver path saved by a previous run, if still present."""
+    try:
+        data = json.loads(CHROMEDRIVER_CACHE_FILE.read_text(encoding="utf-8"))
+    except (OSError, ValueError):
+        return None
+    path = data.get("path") if isinstance(data, dict) else None
+    return path if path and Path(path).is_file() else None
+
+
+@functools.lru_cache(maxsize=1)
+def get_chromedriver_path() -> str:
+    """
+    Resolve the ChromeDriver executable, reusing the last resolved path.
+
+    ChromeDriverManager is only consulted when no cached path exists; if it
+    fails (e.g. offline), a chromedriver on PATH is used instead.
+    """
+    cached = _read_cached_chromedriver_path()
+    if cached:
+        return cached
+
+    from webdriver_manager.chrome import ChromeDriverManager
+
+    try:
+        path = ChromeDriverManager().install()
+    except Exception:
+        system_driver = shutil.which("chromedriver")
+        if system_driver:
+            return system_driver
+        raise
+
+    try:
+        CHROMEDRIVER_CACHE_FILE.parent.mkdir(parents=True, exist_ok=True)
+        CHROMEDRIVER_CACHE_FILE.write_text(
+            json.dumps({"path": path}), encoding="utf-8"
+        )
+    except OSError:
+        pass
+    return path
+
+
+def clear_chromedriver_cache() -> None:
+    """Forget the cached ChromeDriver path (e.g. after a Chrome update)."""
+    get_chromedriver_path.cache_clear()
+    CHROMEDRIVER_CACHE_FILE.unlink(missing_ok=True)
+
+
 def create_chrome_driver(
     download_dir: Path,
-    headless: bool = False,
+    headless: bool = True,
     logger: logging.Logger | None = None
 ) -> webdriver.Chrome:
-    """Create a Chrome WebDriver configured for automatic file downloads."""
+    """
+    Create a Chrome WebDriver configured for automatic file downloads.
+
+    The driver is meant to be created once and reused for every year; use
+    set_download_directory to retarget downloads instead of restarting Chrome.
+    """
+    from selenium import webdriver
+    from selenium.common.exceptions import SessionNotCreatedException
+    from selenium.webdriver.chrome.options import Options
+    from selenium.webdriver.chrome.service import Service
+
     options = Options()
     download_dir_str = str(download_dir.resolve())
 
@@ -386,6 +636,9 @@ def create_chrome_driver(
         "profile.default_content_settings.popups": 0,
         "profile.content_settings.exceptions.automatic_downloads.*.setting": 1,
         "profile.default_content_setting_values.automatic_downloads": 1,
+        # Skip resources that are never needed to find download links
+        "profile.managed_default_content_settings.images": 2,
+        "profile.managed_default_content_settings.plugins": 2,
     }
     options.add_experimental_option("prefs", prefs)
 
@@ -393,6 +646,11 @@ def create_chrome_driver(
     options.add_argument("--disable-dev-shm-usage")
     options.add_argument("--disable-gpu")
     options.add_argument("--window-size=1200,800")
+    # BRIMR pages are only read for their download links
+    options.add_argument("--disable-extensions")
+    options.add_argument("--disable-blink-features=AutomationControlled")
+    options.add_argument("--blink-settings=imagesEnabled=false")
+    options.add_argument("--disable-features=Translate,BackForwardCache")
 
     if headless:
         options.add_argument("--headless=new")
@@ -400,14 +658,27 @@ def create_chrome_driver(
     if logger:
         logger.info("Installing/locating ChromeDriver...")
 
-    service = Service(ChromeDriverManager().install())
-    driver = webdriver.Chrome(service=service, options=options)
+    try:
+        service = Service(get_chromedriver_path())
+        driver = webdriver.Chrome(service=service, options=options)
+    except SessionNotCreatedException:
+        # Cached driver no longer matches the installed Chrome version
+        if logger:
+            logger.info("Cached ChromeDriver is stale, resolving a new one...")
+        clear_chromedriver_cache()
+        service = Service(get_chromedriver_path())
+        driver = webdriver.Chrome(service=service, options=options)
+    driver.set_page_load_timeout(PAGE_LOAD_TIMEOUT)
 
     driver.execute_cdp_cmd(
         "Page.setDownloadBehavior",
         {"behavior": "allow", "downloadPath": download_dir_str}
     )
 
+    # Fail junk requests inside Chrome before they reach the network
+    driver.execute_cdp_cmd("Network.enable", {})
+    driver.execute_cdp_cmd("Network.setBlockedURLs", {"urls": BLOCKED_URL_PATTERNS})
+
     if logger:
         logger.info(f"Chrome driver ready (headless={headless})")
 
@@ -423,44 +694,222 @@ def set_download_directory(driver: webdriver.Chrome, directory: Path) -> None:
     )
 
 
+def list_directory_names(directory: Path) -> frozenset[str]:
+    """Snapshot the entry names in a directory (empty if it cannot be read)."""
+    try:
+        with os.scandir(directory) as entries:
+            return frozenset(entry.name for entry in entries)
+    except OSError:
+        return frozenset()
+
+
 def wait_for_download_complete(
     download_dir: Path,
     timeout: int = DOWNLOAD_TIMEOUT,
-    cancel_event: threading.Event | None = None
+    cancel_event: threading.Event | None = None,
+    existing: frozenset[str] = frozenset()
 ) -> Path | None:
-    """Wait for a download to complete and return the downloaded file path."""
-    end_time = time.time() + timeout
+    """
+    Wait for a download to complete and return the downloaded file path.
+
+    ``existing`` is a snapshot from list_directory_names taken before the
+    download started; those entries are ignored so only the new file counts,
+    even if the directory holds earlier or leftover downloads.
+
+    The poll interval backs off from DOWNLOAD_CHECK_INTERVAL up to
+    DOWNLOAD_CHECK_MAX_INTERVAL, and waits on ``cancel_event`` so a cancel
+    request wakes the loop immediately instead of after the next sleep.
+    """
+    end_time = time.monotonic() + timeout
+    interval = DOWNLOAD_CHECK_INTERVAL
+    sleep = cancel_event.wait if cancel_event else time.sleep
 
-    while time.time() < end_time:
+    while True:
         if cancel_event and cancel_event.is_set():
             return None
 
+        # scandir entries carry the file type, so no extra stat per entry
+        in_progress = False
+        excel_entries: list[os.DirEntry] = []
         try:
-            files = list(download_dir.iterdir())
+            with os.scandir(download_dir) as entries:
+                for entry in entries:
+                    if entry.name in existing:
+                        continue
+                    name = entry.name.lower()
+                    if name.endswith(TEMP_DOWNLOAD_SUFFIXES):
+                        in_progress = True
+                        break
+                    if name.endswith(EXCEL_SUFFIXES) and entry.is_file():
+                        excel_entries.append(entry)
         except OSError:
-            time.sleep(DOWNLOAD_CHECK_INTERVAL)
-            continue
+            pass
+
+        if excel_entries and not in_progress:
+            if len(excel_entries) == 1:
+                return Path(excel_entries[0].path)
+            newest = max(excel_entries, key=lambda e: e.stat().st_mtime)
+            return Path(newest.path)
+
+        remaining = end_time - time.monotonic()
+        if remaining <= 0:
+            return None
+
+        sleep(min(interval, remaining))
+        interval = min(interval * 1.5, DOWNLOAD_CHECK_MAX_INTERVAL)
+
 
-        temp_suffixes = (".crdownload", ".tmp", ".part")
-        excel_suffixes = (".xls", ".xlsx")
-        temp_files = [f for f in files if f.suffix.lower() in temp_suffixes]
-        excel_files = [
-            f for f in files
-            if f.suffix.lower() in excel_suffixes and f.is_file()
-        ]
+# =============================================================================
+# Direct HTTP Downloads
+# =============================================================================
 
-        if excel_files and not temp_files:
-            return max(excel_files, key=lambda f: f.stat().st_mtime)
 
-        time.sleep(DOWNLOAD_CHECK_INTERVAL)
+def copy_driver_cookies(driver: webdriver.Chrome, session: requests.Session) -> None:
+    """Copy the browser's cookies into an HTTP session."""
+    for cookie in driver.get_cookies():
+        session.cookies.set(
+            cookie["name"], cookie["value"],
+            domain=cookie.get("domain", ""), path=cookie.get("path", "/"),
+        )
 
+
+def download_file(
+    session: requests.Session,
+    url: str,
+    dest: Path,
+    cancel_event: threading.Event | None = None
+) -> str | None:
+    """
+    Stream a file straight to ``dest`` over HTTP, bypassing the browser.
+
+    Data is written to ``<dest>.part`` and atomically renamed into place, so a
+    file at ``dest`` is always complete. Returns the BLAKE2b hex digest of the
+    content, or None if cancelled. Raises requests.RequestException or OSError
+    on failure; the partial file is removed in both cases.
+    """
+    if cancel_event and cancel_event.is_set():
+        return None
+
+    tmp = dest.with_name(dest.name + ".part")
+    digest = hashlib.blake2b(digest_size=16)
+    try:
+        with session.get(url, stream=True, timeout=DOWNLOAD_TIMEOUT) as response:
+            response.raise_for_status()
+            if "text/html" in response.headers.get("Content-Type", ""):
+                # Error or challenge page instead of the spreadsheet
+                raise requests.RequestException(f"Got an HTML page for {url}")
+
+            # Read the raw stream in 1 MiB blocks into an unbuffered file, so
+            # each block costs one read and one write syscall
+            raw = response.raw
+            raw.decode_content = True
+            with open(tmp, "wb", buffering=0) as f:
+                while chunk := raw.read(1 << 20):
+                    if cancel_event and cancel_event.is_set():
+                        break
+                    f.write(chunk)
+                    digest.update(chunk)
+                else:
+                    f.close()
+                    os.replace(tmp, dest)
+                    return digest.hexdigest()
+    except Urllib3HTTPError as e:
+        # Raw reads surface urllib3 errors that iter_content() used to wrap
+        tmp.unlink(missing_ok=True)
+        raise requests.RequestException(e) from e
+    except BaseException:
+        tmp.unlink(missing_ok=True)
+        raise
+
+    tmp.unlink(missing_ok=True)
     return None
 
 
+def load_hash_index(folder: Path) -> dict[str, list]:
+    """Load the digest -> [relative path, size, mtime_ns] sidecar index."""
+    try:
+        index = json.loads((folder / HASH_INDEX_FILENAME).read_text(encoding="utf-8"))
+    except (OSError, ValueError):
+        return {}
+    return index if isinstance(index, dict) else {}
+
+
+def save_hash_index(folder: Path, index: dict[str, list]) -> None:
+    """Write the sidecar index atomically."""
+    path = folder / HASH_INDEX_FILENAME
+    tmp = path.with_name(path.name + ".part")
+    try:
+        tmp.write_text(json.dumps(index, indent=1), encoding="utf-8")
+        os.replace(tmp, path)
+    except OSError:
+        tmp.unlink(missing_ok=True)
+
+
+def deduplicate_file(
+    path: Path, digest: str, folder: Path, index: dict[str, list]
+) -> bool:
+    """
+    Hard-link ``path`` to an earlier byte-identical download under ``folder``.
+
+    Returns True if ``path`` now shares storage with the earlier file. Otherwise
+    ``path`` is recorded in ``index`` as the original for ``digest``. Entries
+    whose file has since changed (size or mtime) are not trusted.
+    """
+    entry = index.get(digest)
+    if entry:
+        original = folder / entry[0]
+        try:
+            st = original.stat()
+        except OSError:
+            st = None
+        if (
+            st is not None
+            and original != path
+            and [st.st_size, st.st_mtime_ns] == entry[1:]
+        ):
+            link = path.with_name(path.name + ".link")
+            try:
+                os.link(original, link)
+                os.replace(link, path)
+                return True
+            except OSError:
+                link.unlink(missing_ok=True)  # e.g. filesystem without hard links
+                return False
+
+    st = path.stat()
+    index[digest] = [path.relative_to(folder).as_posix(), st.st_size, st.st_mtime_ns]
+    return False
+
+
 # =============================================================================
 # GUI Application
 # =============================================================================
 
+# Shared named fonts, created once by _init_fonts() after the Tk root exists.
+# Widgets given None fall back to the theme's default font.
+_FONT_TITLE: tkfont.Font | None = None
+_FONT_SUBTITLE: tkfont.Font | None = None
+_FONT_BODY: tkfont.Font | None = None
+_FONT_NOTE: tkfont.Font | None = None
+_FONT_SMALL: tkfont.Font | None = None
+_FONT_SMALL_NOTE: tkfont.Font | None = None
+_FONT_BUTTON: tkfont.Font | None = None
+
+
+def _init_fonts() -> None:
+    """Create the shared fonts and button style; requires a Tk root."""
+    global _FONT_TITLE, _FONT_SUBTITLE, _FONT_BODY
+    global _FONT_NOTE, _FONT_SMALL, _FONT_SMALL_NOTE, _FONT_BUTTON
+    _FONT_TITLE = tkfont.Font(family="Segoe UI", size=14, weight="bold")
+    _FONT_SUBTITLE = tkfont.Font(family="Segoe UI", size=10)
+    _FONT_BODY = tkfont.Font(family="Segoe UI", size=9)
+    _FONT_NOTE = tkfont.Font(family="Segoe UI", size=9, slant="italic")
+    _FONT_SMALL = tkfont.Font(family="Segoe UI", size=8)
+    _FONT_SMALL_NOTE = tkfont.Font(family="Segoe UI", size=8, slant="italic")
+    _FONT_BUTTON = tkfont.Font(family="Segoe UI", size=10, weight="bold")
+
+    ttk.Style().configure("Accent.TButton", font=_FONT_BUTTON)
+
 
 class BRIMRDownloaderApp:
     """Thread-safe GUI application for downloading BRIMR NIH Funding Excel files."""
@@ -474,11 +923,26 @@ class BRIMRDownloaderApp:
         self.downloads_folder: Path = get_downloads_folder()
         self.output_folder: Path = self.downloads_folder / "BRIMR_Data"
         self.year_vars: dict[int, tk.BooleanVar] = {}
-        self.available_years: list[int] = []
+        self.available_years: list[int] = []  # Ascending, like year_vars
+        self.available_years_desc: list[int] = []  # Newest first, for display
+        # Pooled checkbutton rows re-pointed at whichever years are in view
+        self._year_rows: list[list[ttk.Checkbutton]] = []
+        self._first_year_row: int | None = None
         self.is_downloading: bool = False
-        self.headless_var: tk.BooleanVar = tk.BooleanVar(value=False)
+        self.headless_var: tk.BooleanVar = tk.BooleanVar(value=True)
 
-        self.ui_queue: queue.Queue[tuple[Callable, tuple]] = queue.Queue()
+        # Resolved once; the mousewheel handler runs for every scroll event
+        system = platform.system()
+        self._is_linux: bool = system == "Linux"
+        self._is_darwin: bool = system == "Darwin"
+        self._wheel_divisor: int = 1 if self._is_darwin else 120
+
+        # Latest status/progress plus one-shot callbacks, applied once per tick
+        self._ui_lock: threading.Lock = threading.Lock()
+        self._pending: dict = self._empty_pending()
+        self._poll_ms: int = UI_QUEUE_POLL_MS_MIN
+        self._poll_after_id: str | None = None
+        self._detecting_years: bool = False
         self.cancel_event: threading.Event = threading.Event()
         self.logger: logging.Logger | None = None
 
@@ -493,41 +957,83 @@ class BRIMRDownloaderApp:
     def _start_ui_queue_polling(self) -> None:
         self._drain_ui_queue()
 
+    @staticmethod
+    def _empty_pending() -> dict:
+        return {"status": None, "progress": None, "callbacks": deque()}
+
     def _drain_ui_queue(self) -> None:
-        try:
-            while True:
-                fn, args = self.ui_queue.get_nowait()
-                fn(*args)
-        except queue.Empty:
-            pass
-        self.root.after(UI_QUEUE_POLL_MS, self._drain_ui_queue)
+        with self._ui_lock:
+            pending, self._pending = self._pending, self._empty_pending()
+
+        # Superseded status/progress updates were overwritten before this tick,
+        # so each widget is reconfigured at most once
+        status = pending["status"]
+        if status is not None:
+            self._apply_status(*status)
+
+        progress = pending["progress"]
+        if progress is not None:
+            self._apply_progress(*progress)
+
+        for fn, args in pending["callbacks"]:
+            fn(*args)
+
+        # Poll quickly while work is flowing or a worker may produce updates;
+        # back off only when truly idle
+        if (
+            status is not None or progress is not None or pending["callbacks"]
+            or self.is_downloading or self._detecting_years
+        ):
+            self._poll_ms = UI_QUEUE_POLL_MS_MIN
+        else:
+            self._poll_ms = min(self._poll_ms * 2, UI_QUEUE_POLL_MS_MAX)
+        self._poll_after_id = self.root.after(self._poll_ms, self._drain_ui_queue)
+
+    def _wake_ui_queue(self) -> None:
+        """
+        Drain now instead of waiting out a backed-off poll interval.
+
+        Tk thread only; workers never call into Tk and rely on the loop
+        polling at full rate while they run.
+        """
+        if self._poll_after_id is not None:
+            self.root.after_cancel(self._poll_after_id)
+        self._drain_ui_queue()
 
     def _enqueue_ui(self, fn: Callable, *args) -> None:
-        self.ui_queue.put((fn, args))
+        with self._ui_lock:
+            self._pending["callbacks"].append((fn, args))
 
     def _update_status(self, message: str, detail: str = "") -> None:
-        def apply():
-            self.status_label.config(text=message)
-            self.detail_label.config(text=detail)
-        self._enqueue_ui(apply)
+        with self._ui_lock:
+            self._pending["status"] = (message, detail)
 
     def _update_progress(self, value: int, maximum: int) -> None:
-        def apply():
-            self.progress_bar["maximum"] = maximum
-            self.progress_bar["value"] = value
-        self._enqueue_ui(apply)
+        with self._ui_lock:
+            self._pending["progress"] = (value, maximum)
 
     def _show_info(self, title: str, message: str) -> None:
-        self._enqueue_ui(lambda: messagebox.showinfo(title, message))
+        self._enqueue_ui(messagebox.showinfo, title, message)
 
     def _show_error(self, title: str, message: str) -> None:
-        self._enqueue_ui(lambda: messagebox.showerror(title, message))
+        self._enqueue_ui(messagebox.showerror, title, message)
 
     def _set_buttons_state(self, downloading: bool) -> None:
-        def apply():
-            self.download_btn.config(state="disabled" if downloading else "normal")
-            self.cancel_btn.config(state="normal" if downloading else "disabled")
-        self._enqueue_ui(apply)
+        self._enqueue_ui(self._apply_buttons_state, downloading)
+
+    # Applied on the Tk thread by _drain_ui_queue
+
+    def _apply_status(self, message: str, detail: str) -> None:
+        self.status_label.config(text=message)
+        self.detail_label.config(text=detail)
+
+    def _apply_progress(self, value: int, maximum: int) -> None:
+        self.progress_bar["maximum"] = maximum
+        self.progress_bar["value"] = value
+
+    def _apply_buttons_state(self, downloading: bool) -> None:
+        self.download_btn.config(state="disabled" if downloading else "normal")
+        self.cancel_btn.config(state="normal" if downloading else "disabled")
 
     # -------------------------------------------------------------------------
     # UI Setup
@@ -547,17 +1053,17 @@ class BRIMRDownloaderApp:
     def _create_header(self, parent: ttk.Frame) -> None:
         ttk.Label(
             parent, text="BRIMR NIH Funding Data Downloader",
-            font=("Segoe UI", 14, "bold"),
+            font=_FONT_TITLE,
         ).pack(pady=(0, 5))
 
         ttk.Label(
             parent, text="Downloads Excel files using Chrome browser automation",
-            font=("Segoe UI", 10),
+            font=_FONT_SUBTITLE,
         ).pack(pady=(0, 5))
 
         ttk.Label(
             parent, text=f"Platform: {platform.system()} {platform.machine()}",
-            font=("Segoe UI", 8, "italic"), foreground="gray",
+            font=_FONT_SMALL_NOTE, foreground="gray",
         ).pack(pady=(0, 10))
 
     def _create_folder_info(self, parent: ttk.Frame) -> None:
@@ -565,12 +1071,12 @@ class BRIMRDownloaderApp:
         folder_frame.pack(fill=tk.X, pady=(0, 10))
 
         ttk.Label(
-            folder_frame, text="Save to:", font=("Segoe UI", 9)
+            folder_frame, text="Save to:", font=_FONT_BODY
         ).pack(side=tk.LEFT)
 
         self.folder_label = ttk.Label(
             folder_frame, text=str(self.output_folder),
-            font=("Segoe UI", 9, "italic"), foreground="gray",
+            font=_FONT_NOTE, foreground="gray",
         )
         self.folder_label.pack(side=tk.LEFT, padx=(5, 10))
 
@@ -607,33 +1113,29 @@ class BRIMRDownloaderApp:
         ).pack(side=tk.LEFT)
 
         self.canvas = tk.Canvas(self.years_frame, height=180)
-        scrollbar = ttk.Scrollbar(
+        self.years_scrollbar = ttk.Scrollbar(
             self.years_frame, orient="vertical", command=self.canvas.yview
         )
         self.scrollable_frame = ttk.Frame(self.canvas)
 
-        self.scrollable_frame.bind(
-            "<Configure>",
-            lambda e: self.canvas.configure(scrollregion=self.canvas.bbox("all"))
-        )
+        self.scrollable_frame.bind("<Configure>", self._update_scrollregion)
 
         self.canvas.create_window((0, 0), window=self.scrollable_frame, anchor="nw")
-        self.canvas.configure(yscrollcommand=scrollbar.set)
+        self.canvas.configure(yscrollcommand=self._on_years_scrolled)
         self.canvas.pack(side=tk.LEFT, fill=tk.BOTH, expand=True)
-        scrollbar.pack(side=tk.RIGHT, fill=tk.Y)
+        self.years_scrollbar.pack(side=tk.RIGHT, fill=tk.Y)
 
         self._bind_mousewheel()
 
         self.loading_label = ttk.Label(
             self.scrollable_frame,
             text="Detecting available years from BRIMR website...",
-            font=("Segoe UI", 9, "italic"),
+            font=_FONT_NOTE,
         )
         self.loading_label.pack(pady=20)
 
     def _bind_mousewheel(self) -> None:
-        system = platform.system()
-        if system == "Linux":
+        if self._is_linux:
             self.canvas.bind_all(
                 "<Button-4>", lambda e: self.canvas.yview_scroll(-1, "units")
             )
@@ -644,36 +1146,87 @@ class BRIMRDownloaderApp:
             self.canvas.bind_all("<MouseWheel>", self._on_mousewheel)
 
     def _on_mousewheel(self, event: Event) -> None:
-        if platform.system() == "Darwin":
-            delta = -1 * event.delta
-        else:
-            delta = -1 * (event.delta // 120)
-        self.canvas.yview_scroll(int(delta), "units")
+        self.canvas.yview_scroll(-(event.delta // self._wheel_divisor), "units")
 
     def _detect_years_async(self) -> None:
         def detect():
             years = detect_available_years()
             self._enqueue_ui(self._populate_years, years)
+
+        self._detecting_years = True
         threading.Thread(target=detect, daemon=True).start()
 
     def _populate_years(self, years: list[int]) -> None:
+        # Sorted once here; year_vars keeps this order so selections come
+        # back oldest-first without re-sorting
+        self._detecting_years = False
+        years = sorted(years)
         self.available_years = years
+        self.available_years_desc = years[::-1]
         self.loading_label.destroy()
 
-        year_range = f"{min(years)}-{max(years)}" if years else "None found"
+        year_range = f"{years[0]}-{years[-1]}" if years else "None found"
         self.years_frame.configure(text=f"Select Years ({year_range} available)")
 
-        for i, year in enumerate(years):
-            var = tk.BooleanVar(value=False)
-            self.year_vars[year] = var
-            cb = ttk.Checkbutton(
-                self.scrollable_frame, text=str(year), variable=var, width=8
-            )
-            cb.grid(row=i // 5, column=i % 5, sticky="w", padx=5, pady=2)
+        self.year_vars = {year: tk.BooleanVar(value=False) for year in years}
+
+        # Lay out everything first and size the scrollregion once at the end,
+        # rather than on every intermediate <Configure> of the frame
+        self.scrollable_frame.unbind("<Configure>")
+
+        # Fixed-height rows let the frame reserve space for every year while
+        # only the rows in view hold real widgets.
+        total_rows = -(-len(years) // YEAR_COLUMNS)
+        for row in range(total_rows):
+            self.scrollable_frame.rowconfigure(row, minsize=YEAR_ROW_HEIGHT)
+        self._refresh_visible_years()
 
         self.scrollable_frame.update_idletasks()
+        self._update_scrollregion()
+        self.scrollable_frame.bind("<Configure>", self._update_scrollregion)
+
+    def _update_scrollregion(self, event: Event | None = None) -> None:
         self.canvas.configure(scrollregion=self.canvas.bbox("all"))
 
+    def _on_years_scrolled(self, first: str, last: str) -> None:
+        self.years_scrollbar.set(first, last)
+        self._refresh_visible_years()
+
+    def _refresh_visible_years(self) -> None:
+        """Point the pooled checkbuttons at the rows currently in view."""
+        years = self.available_years_desc
+        total_rows = -(-len(years) // YEAR_COLUMNS)
+        if not total_rows:
+            return
+
+        view_height = max(self.canvas.winfo_height(), int(self.canvas.cget("height")))
+        wanted = min(total_rows, view_height // YEAR_ROW_HEIGHT + 2)
+        grew = len(self._year_rows) < wanted
+        while len(self._year_rows) < wanted:
+            self._year_rows.append([
+                ttk.Checkbutton(self.scrollable_frame, width=8)
+                for _ in range(YEAR_COLUMNS)
+            ])
+
+        first = min(
+            int(self.canvas.yview()[0] * total_rows),
+            total_rows - len(self._year_rows),
+        )
+        if first == self._first_year_row and not grew:
+            return
+        self._first_year_row = first
+
+        for offset, widgets in enumerate(self._year_rows):
+            row = first + offset
+            for column, cb in enumerate(widgets):
+                i = row * YEAR_COLUMNS + column
+                if i >= len(years):
+                    cb.grid_remove()
+                    continue
+                year = years[i]
+                cb.configure(text=str(year), variable=self.year_vars[year])
+                cb.grid(row=row, column=column, sticky="w", padx=5, pady=2)
+
     def _create_options(self, parent: ttk.Frame) -> None:
         options_frame = ttk.LabelFrame(parent, text="Options", padding="10")
         options_frame.pack(fill=tk.X, pady=(0, 10))
@@ -687,7 +1240,7 @@ class BRIMRDownloaderApp:
         ttk.Label(
             options_frame,
             text="Files organized: Year → Category → Files | Logs saved with downloads",
-            font=("Segoe UI", 8, "italic"), foreground="gray",
+            font=_FONT_SMALL_NOTE, foreground="gray",
         ).pack(anchor="w", pady=(5, 0))
 
     def _create_progress_section(self, parent: ttk.Frame) -> None:
@@ -700,16 +1253,13 @@ class BRIMRDownloaderApp:
         self.progress_bar = ttk.Progressbar(progress_frame, mode="determinate")
         self.progress_bar.pack(fill=tk.X, pady=(5, 0))
 
-        self.detail_label = ttk.Label(progress_frame, text="", font=("Segoe UI", 8))
+        self.detail_label = ttk.Label(progress_frame, text="", font=_FONT_SMALL)
         self.detail_label.pack(anchor="w", pady=(5, 0))
 
     def _create_buttons(self, parent: ttk.Frame) -> None:
         btn_frame = ttk.Frame(parent)
         btn_frame.pack(fill=tk.X, pady=(0, 5))
 
-        style = ttk.Style()
-        style.configure("Accent.TButton", font=("Segoe UI", 10, "bold"))
-
         self.download_btn = ttk.Button(
             btn_frame, text="Download Selected Years",
             command=self._start_download, style="Accent.TButton",
@@ -736,11 +1286,11 @@ class BRIMRDownloaderApp:
 
     def _select_recent_5(self) -> None:
         self._deselect_all()
-        for year in self.available_years[:5]:
-            if year in self.year_vars:
-                self.year_vars[year].set(True)
+        for year in self.available_years_desc[:5]:
+            self.year_vars[year].set(True)
 
     def _get_selected_years(self) -> list[int]:
+        """Return the checked years, oldest first."""
         return [year for year, var in self.year_vars.items() if var.get()]
 
     # -------------------------------------------------------------------------
@@ -757,7 +1307,7 @@ class BRIMRDownloaderApp:
         if self.is_downloading:
             return
 
-        year_str = ", ".join(str(y) for y in sorted(selected_years, reverse=True))
+        year_str = ", ".join(map(str, reversed(selected_years)))
         mode = "headless (no window)" if self.headless_var.get() else "visible"
 
         if not messagebox.askyesno(
@@ -778,6 +1328,7 @@ class BRIMRDownloaderApp:
         threading.Thread(
             target=self._download_years, args=(selected_years,), daemon=True
         ).start()
+        self._wake_ui_queue()  # Back to full-rate polling for the batch
 
     def _cancel_download(self) -> None:
         if self.is_downloading:
@@ -786,180 +1337,325 @@ class BRIMRDownloaderApp:
             if self.logger:
                 self.logger.info("Cancel requested by user")
 
-    def _download_years(self, years: list[int]) -> None:
-        """Download Excel files for selected years using a single Chrome instance."""
-        downloaded = 0
+    def _download_with_browser(
+        self,
+        driver: webdriver.Chrome,
+        file_url: str,
+        final_path: Path
+    ) -> bool:
+        """
+        Download a file through Chrome straight into ``final_path``'s folder.
+
+        Only entries that appear after the download starts are considered, so
+        the folder needs no clearing; the result is renamed in place if Chrome
+        chose a different name.
+        """
+        folder = final_path.parent
+        set_download_directory(driver, folder)
+        existing = list_directory_names(folder)
+        driver.get(file_url)
+
+        downloaded_file = wait_for_download_complete(
+            folder, cancel_event=self.cancel_event, existing=existing
+        )
+        if downloaded_file and downloaded_file.exists():
+            if downloaded_file != final_path:
+                try:
+                    os.replace(downloaded_file, final_path)
+                except OSError:
+                    shutil.move(downloaded_file, final_path)
+            return True
+        return False
+
+    def _plan_year_files(
+        self, year: int, excel_urls: list[str]
+    ) -> tuple[list[tuple[int, str, str, str, Path]], int]:
+        """
+        Work out where each of a year's files goes and which still need fetching.
+
+        Returns the download jobs as (year, url, filename, category, final path)
+        and the number of files skipped because they already exist (or repeat
+        within the page).
+
+        Names are reserved in memory only; nothing is written at a final path
+        until its download has completed and is renamed into place.
+        """
+        log = self.logger
+        debug = log is not None and log.isEnabledFor(logging.DEBUG)
+        year_folder = self.output_folder / str(year)
+        jobs: list[tuple[int, str, str, str, Path]] = []
+        queued_paths: set[Path] = set()
         skipped = 0
-        failed = 0
+
+        # Category folders left by earlier runs need no mkdir at all
+        with os.scandir(year_folder) as entries:
+            created_dirs: set[Path] = {
+                year_folder / entry.name for entry in entries if entry.is_dir()
+            }
+
+        for file_url in excel_urls:
+            filename = sanitize_filename(filename_from_url(file_url))
+            category = categorize_file(filename)
+            category_folder = year_folder / category
+            final_path = category_folder / filename
+
+            if final_path in queued_paths:
+                skipped += 1
+                continue
+
+            # A folder that had to be created cannot hold the file yet
+            if category_folder not in created_dirs:
+                category_folder.mkdir(exist_ok=True)
+                created_dirs.add(category_folder)
+            elif final_path.exists():
+                skipped += 1
+                if debug:
+                    log.debug("⏭ Exists: %s/%s", category, filename)
+                continue
+
+            queued_paths.add(final_path)
+            jobs.append((year, file_url, filename, category, final_path))
+
+        return jobs, skipped
+
+    def _download_years(self, years: list[int]) -> None:
+        """
+        Download Excel files for selected years using a single Chrome instance.
+
+        Chrome loads the year pages one after another while the files found on
+        earlier pages are already downloading in the thread pool, so page loads
+        and transfers overlap across years.
+        """
+        log = self.logger  # Fixed for the whole batch
+        debug = log is not None and log.isEnabledFor(logging.DEBUG)
+        counts: Counter[str] = Counter()  # Shared with download callbacks
+        counts_lock = threading.Lock()
+        browser_jobs: deque[tuple[int, str, str, str, Path]] = deque()
         years_skipped = 0  # Years with no data or failed to load
         cancelled = False
+        fatal = False
+
+        # Progress is measured in years: each year is one unit, split evenly
+        # over its files, so the bar only moves forward as pages are planned
+        progress = 0.0
+        progress_max = len(years) * 100
+        file_share: dict[int, float] = {}  # Progress units per file, by year
 
         self.output_folder.mkdir(parents=True, exist_ok=True)
-        temp_dir = self.output_folder / "_temp_downloads"
-        temp_dir.mkdir(exist_ok=True)
 
         driver: webdriver.Chrome | None = None
+        session = create_http_session()
+        executor = ThreadPoolExecutor(max_workers=DOWNLOAD_WORKERS)
+        hash_index = load_hash_index(self.output_folder)
+
+        # Progress is published while counts_lock is held so concurrent
+        # updates reach the coalesced UI slot in order (_ui_lock never takes
+        # counts_lock, so this cannot deadlock)
+        def advance(units: float) -> None:
+            nonlocal progress
+            with counts_lock:
+                progress += units
+                self._update_progress(round(progress * 100), progress_max)
+
+        def on_download_done(
+            job: tuple[int, str, str, str, Path], future: Future
+        ) -> None:
+            # Runs on the worker thread that finished the download
+            nonlocal progress
+            year, _, filename, category, final_path = job
+            outcome = "cancelled"
+            try:
+                digest = None if future.cancelled() else future.result()
+            except (requests.RequestException, OSError) as e:
+                outcome = "browser"
+                if debug:
+                    log.debug(
+                        "HTTP download failed for %s (%s), retrying through the "
+                        "browser", filename, e
+                    )
+            except Exception:
+                outcome = "failed"
+                if log:
+                    log.exception("Failed: %s", filename)
+            else:
+                if digest:
+                    outcome = "downloaded"
+                    if log:
+                        log.info("✓ %s/%s/%s", year, category, filename)
+
+            with counts_lock:
+                counts["done"] += 1
+                if outcome == "browser":
+                    browser_jobs.append(job)
+                else:
+                    # Browser retries advance the bar once they are attempted
+                    progress += file_share[year]
+                    if outcome != "cancelled":
+                        counts[outcome] += 1
+                # Same bytes already downloaded (e.g. another year)
+                if outcome == "downloaded" and deduplicate_file(
+                    final_path, digest, self.output_folder, hash_index
+                ):
+                    if debug:
+                        log.debug("Hard-linked duplicate: %s", filename)
+                self._update_progress(round(progress * 100), progress_max)
+                if outcome == "downloaded":
+                    self._update_status(
+                        f"Downloading: {counts['done']}/{counts['queued']}",
+                        f"✓ {year}/{category}/{filename}",
+                    )
 
         try:
+            # Inside the try so a missing Selenium is reported like any other
+            # fatal error and the UI is reset in the finally clause
+            from selenium.common.exceptions import TimeoutException
+            from selenium.webdriver.support.ui import WebDriverWait
+
             self._update_status("Starting Chrome browser...", "This may take a moment")
             driver = create_chrome_driver(
-                temp_dir, headless=self.headless_var.get(), logger=self.logger
+                self.output_folder,
+                headless=self.headless_var.get(),
+                logger=log,
+            )
+            # Cookies are copied per page; the HTTP requests should also carry
+            # the same User-Agent the browser used when they were issued
+            session.headers["User-Agent"] = driver.execute_script(
+                "return navigator.userAgent;"
             )
 
-            # Warmup: navigate to a blank page first to ensure driver is fully ready
-            driver.get("about:blank")
-            time.sleep(0.5)
-
-            for year in sorted(years):  # Oldest to newest
+            for year in years:  # Oldest to newest, as _get_selected_years returns
                 if self.cancel_event.is_set():
                     cancelled = True
                     break
 
                 year_folder = self.output_folder / str(year)
                 year_folder.mkdir(exist_ok=True)
-                set_download_directory(driver, temp_dir)
 
                 url = BASE_URL_TEMPLATE.format(year=year)
                 self._update_status(f"Loading {year} page...", url)
-                if self.logger:
-                    self.logger.info(f"Processing year {year}")
+                if log:
+                    log.info("Processing year %s", year)
 
                 try:
+                    # Blocks until the document is loaded (page load timeout)
                     driver.get(url)
-                    WebDriverWait(driver, PAGE_LOAD_TIMEOUT).until(
-                        EC.presence_of_element_located((By.TAG_NAME, "body"))
-                    )
-                    time.sleep(EXTRA_RENDER_WAIT)
 
-                    # Wait a bit more for dynamic content to load
-                    # Try to wait for at least one link to appear
+                    # Let scripts settle instead of sleeping a fixed time
                     try:
-                        WebDriverWait(driver, 5).until(
-                            EC.presence_of_element_located(
-                                (By.CSS_SELECTOR, "a[href*='.xls']")
+                        WebDriverWait(driver, PAGE_LOAD_TIMEOUT).until(
+                            lambda d: d.execute_script(PAGE_READY_SCRIPT)
+                        )
+                    except TimeoutException:
+                        pass  # e.g. long-polling requests; harvest anyway
+
+                    # Poll the link harvest itself so waiting for dynamic
+                    # content and collecting hrefs share one JS round trip
+                    try:
+                        hrefs: list[str] = WebDriverWait(driver, 5).until(
+                            lambda d: d.execute_script(
+                                EXCEL_LINKS_SCRIPT, EXCEL_LINK_SELECTOR
                             )
                         )
-                    except Exception:
-                        pass  # Continue anyway, links might use different format
+                    except TimeoutException:
+                        hrefs = []  # Continue anyway, links might use different format
 
                 except Exception as e:
-                    if self.logger:
-                        self.logger.error(f"Failed to load {year}: {e}")
+                    if log:
+                        log.error("Failed to load %s: %s", year, e)
                     self._update_status(f"⚠ {year}: Page failed to load", str(e)[:50])
                     years_skipped += 1
-                    time.sleep(1)  # Brief pause so user sees the message
+                    advance(1)
                     continue
 
-                links = driver.find_elements(
-                    By.CSS_SELECTOR,
-                    "a[href$='.xls'], a[href$='.xlsx'], "
-                    "a[href$='.XLS'], a[href$='.XLSX'], "
-                    "a[href*='.xls?'], a[href*='.xlsx?']"
-                )
-
-                if self.logger:
-                    self.logger.debug(
-                        f"CSS selector found {len(links)} link elements for {year}"
-                    )
+                # Excel files are fetched over HTTP with the page's cookies
+                copy_driver_cookies(driver, session)
 
+                # The selector already restricts extensions; dedupe in one pass
+                seen: set[str] = set()
                 excel_urls: list[str] = []
-                for link in links:
-                    href = (link.get_attribute("href") or "").strip()
-                    if any(ext in href.lower() for ext in [".xls", ".xlsx"]):
-                        excel_urls.append(href)
-
-                if self.logger:
-                    self.logger.debug(
-                        f"After filtering: {len(excel_urls)} Excel URLs for {year}"
-                    )
-
-                excel_urls = list(dict.fromkeys(excel_urls))
+                for href in hrefs:
+                    if href:
+                        href = href.strip()
+                        if href not in seen:
+                            seen.add(href)
+                            excel_urls.append(href)
 
                 if not excel_urls:
                     self._update_status(
                         f"⚠ {year}: No Excel files found", "Skipping this year"
                     )
-                    if self.logger:
-                        self.logger.warning(f"No Excel files found for {year}")
+                    if log:
+                        log.warning("No Excel files found for %s", year)
                     years_skipped += 1
-                    time.sleep(1)  # Brief pause so user sees the message
+                    advance(1)
                     continue
 
                 self._update_status(
                     f"Found {len(excel_urls)} files for {year}", "Starting..."
                 )
-                if self.logger:
-                    self.logger.info(f"Found {len(excel_urls)} files for {year}")
-
-                for i, file_url in enumerate(excel_urls, 1):
-                    if self.cancel_event.is_set():
-                        cancelled = True
-                        break
-
-                    raw_name = unquote(Path(urlparse(file_url).path).name)
-                    filename = sanitize_filename(raw_name)
-                    category = categorize_file(filename)
-                    category_folder = year_folder / category
-                    final_path = category_folder / filename
-
-                    if final_path.exists():
-                        skipped += 1
-                        self._update_status(
-                            f"{year}: {i}/{len(excel_urls)}",
-                            f"⏭ Exists: {category}/{filename}"
-                        )
-                        self._update_progress(i, len(excel_urls))
-                        continue
+                if log:
+                    log.info("Found %d files for %s", len(excel_urls), year)
+
+                jobs, existing = self._plan_year_files(year, excel_urls)
+                share = 1 / (len(jobs) + existing)
+                file_share[year] = share
+                with counts_lock:
+                    counts["skipped"] += existing
+                    counts["queued"] += len(jobs)
+                advance(existing * share)
+
+                # Don't wait: the next page loads while these download
+                for job in jobs:
+                    future = executor.submit(
+                        download_file, session, job[1], job[4], self.cancel_event
+                    )
+                    future.add_done_callback(functools.partial(on_download_done, job))
 
+            if not cancelled:
+                self._update_status(
+                    "Finishing downloads...",
+                    f"{counts['done']}/{counts['queued']} files done",
+                )
+            # On cancel, queued downloads are dropped without ever starting;
+            # running ones stop at their next chunk via cancel_event
+            executor.shutdown(wait=True, cancel_futures=cancelled)
+
+            # Chrome is not thread-safe, so browser fallbacks run serially.
+            # Jobs are popped as they are attempted; any still queued if this
+            # block is cut short are counted as failed in the finally clause.
+            while browser_jobs:
+                year, file_url, filename, category, final_path = (
+                    browser_jobs.popleft()
+                )
+                if not self.cancel_event.is_set():
                     self._update_status(
-                        f"Downloading {year}: {i}/{len(excel_urls)}", f"→ {filename}"
+                        f"Downloading {year} via browser", f"→ {filename}"
                     )
-                    self._update_progress(i, len(excel_urls))
-
                     try:
-                        for f in temp_dir.iterdir():
-                            try:
-                                f.unlink()
-                            except OSError:
-                                pass
-
-                        driver.get(file_url)
-                        time.sleep(0.5)
-
-                        downloaded_file = wait_for_download_complete(
-                            temp_dir, cancel_event=self.cancel_event
+                        completed = self._download_with_browser(
+                            driver, file_url, final_path
                         )
+                        if completed:
+                            counts["downloaded"] += 1
+                            if log:
+                                log.info("✓ %s/%s/%s", year, category, filename)
+                        elif not self.cancel_event.is_set():
+                            counts["failed"] += 1
+                            if log:
+                                log.warning("⚠ Timeout: %s", filename)
+                    except Exception:
+                        counts["failed"] += 1
+                        if log:
+                            log.exception("Failed: %s", filename)
+                advance(file_share[year])
 
-                        if self.cancel_event.is_set():
-                            cancelled = True
-                            break
-
-                        if downloaded_file and downloaded_file.exists():
-                            category_folder.mkdir(exist_ok=True)
-                            shutil.move(str(downloaded_file), str(final_path))
-                            downloaded += 1
-                            if self.logger:
-                                self.logger.info(f"✓ {category}/{filename}")
-                            self._update_status(
-                                f"{year}: {i}/{len(excel_urls)}",
-                                f"✓ {category}/{filename}"
-                            )
-                        else:
-                            failed += 1
-                            if self.logger:
-                                self.logger.warning(f"⚠ Timeout: {filename}")
-
-                    except Exception as e:
-                        failed += 1
-                        if self.logger:
-                            self.logger.exception(f"Failed: {filename}")
-
-                if cancelled:
-                    break
+            if self.cancel_event.is_set():
+                cancelled = True
 
         except Exception as e:
-            if self.logger:
-                self.logger.exception("Fatal error")
+            fatal = True
+            if log:
+                log.exception("Fatal error")
             self._show_error("Error", f"An error occurred:\n{e}")
 
         finally:
@@ -968,11 +1664,24 @@ class BRIMRDownloaderApp:
                     driver.quit()
                 except Exception:
                     pass
+            executor.shutdown()  # Callbacks may still queue browser retries
+            session.close()
+            save_hash_index(self.output_folder, hash_index)
+
+            # Browser retries that never ran (e.g. Chrome died mid-batch); an
+            # HTTP failure already removed its partial file
+            if browser_jobs and not self.cancel_event.is_set():
+                counts["failed"] += len(browser_jobs)
+                if log:
+                    for _, _, filename, _, _ in browser_jobs:
+                        log.warning("⚠ Not retried: %s", filename)
 
-            shutil.rmtree(temp_dir, ignore_errors=True)
             self.is_downloading = False
             self._set_buttons_state(downloading=False)
 
+            downloaded = counts["downloaded"]
+            skipped = counts["skipped"]
+            failed = counts["failed"]
             summary = (
                 f"Downloaded: {downloaded} | Existed: {skipped} | "
                 f"Failed: {failed} | Years without data: {years_skipped}"
@@ -981,6 +1690,9 @@ class BRIMRDownloaderApp:
             if cancelled:
                 self._update_status("⚠ Download cancelled", summary)
                 self._show_info("Cancelled", f"Download cancelled.\n\n{summary}")
+            elif fatal:
+                # The error itself was already reported in a dialog
+                self._update_status("⚠ Download stopped by an error", summary)
             else:
                 self._update_status("✓ Download complete!", summary)
                 self._update_progress(100, 100)
@@ -993,8 +1705,8 @@ class BRIMRDownloaderApp:
                     f"Files saved to:\n{self.output_folder}"
                 )
 
-            if self.logger:
-                self.logger.info(f"Finished. {summary}")
+            if log:
+                log.info("Finished. %s", summary)
 
 
 # =============================================================================
@@ -1005,6 +1717,7 @@ class BRIMRDownloaderApp:
 def main() -> None:
     root = tk.Tk()
     root.geometry("620x780")
+    _init_fonts()
 
     if platform.system() == "Windows":
         try: